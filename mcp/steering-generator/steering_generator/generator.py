@@ -12,6 +12,8 @@ Supports inclusion modes:
 
 Supports file references: #[[file:<relative_file_name>]]
 """
+import dataclasses
+import functools
 from typing import Any, Literal
 
 OutputFormat = Literal["kiro", "cursor", "copilot", "windsurf", "cline", "aider", "markdown"]
@@ -63,6 +65,14 @@ IDE_CONFIGS = {
     },
 }
 
+# Precomputed output paths so generation doesn't re-format them per call
+_KIRO_DIR = IDE_CONFIGS["kiro"]["path"]
+_OUTPUT_PATHS = {
+    ide: config["path"] + config["filename"]
+    for ide, config in IDE_CONFIGS.items()
+    if not config["multiple_files"]
+}
+
 FRAMEWORK_NAMES = {
     "nextjs": "Next.js 15 (App Router)",
     "nextjs-pages": "Next.js 15 (Pages Router)",
@@ -72,18 +82,89 @@ FRAMEWORK_NAMES = {
     "nuxt": "Nuxt 3",
 }
 
+# Framework families that share generated sections
+_REACT_LIKE = frozenset({"nextjs", "nextjs-pages", "react"})
+_VUE_LIKE = frozenset({"vue", "nuxt"})
+_NEXT_LIKE = frozenset({"nextjs", "nextjs-pages"})
+
+# Key Libraries section: categories in output order, and the line emitted per package
+_KEY_LIB_CATEGORIES = ("Forms", "State", "Data Fetching", "Utilities", "Charts", "Notifications", "Theme")
+_KEY_LIB_LINES = {
+    "zod": "**Validation**: Zod (schema validation)",
+    "zustand": "**State Management**: Zustand",
+    "jotai": "**State Management**: Jotai (atomic)",
+    "swr": "**Data Fetching**: SWR",
+    "date-fns": "**Date Utilities**: date-fns",
+    "dayjs": "**Date Utilities**: Day.js",
+    "sonner": "**Notifications**: Sonner (toast)",
+    "next-themes": "**Theming**: next-themes",
+}
+_KEY_LIB_PREFIX_LINES = (
+    ("react-hook-form", "**Forms**: React Hook Form"),
+    ("@reduxjs/toolkit", "**State Management**: Redux Toolkit"),
+    ("@tanstack/react-query", "**Data Fetching**: TanStack Query"),
+)
+# Categories that list every package, using the package name when there is no known line
+_KEY_LIB_FALLBACK_LABELS = {
+    "Charts": "**Charts**",
+    "Notifications": "**Notifications**",
+}
+
+# Descriptions for well-known environment variables
+_ENV_VAR_DESCRIPTIONS = {
+    "DATABASE_URL": "Database connection string",
+    "NEXT_PUBLIC_SUPABASE_URL": "Supabase project URL",
+    "NEXT_PUBLIC_SUPABASE_ANON_KEY": "Supabase anonymous key (public)",
+    "SUPABASE_SERVICE_ROLE_KEY": "Supabase service role key (server-only)",
+    "NEXTAUTH_SECRET": "NextAuth.js secret",
+    "NEXTAUTH_URL": "NextAuth.js URL",
+    "OPENAI_API_KEY": "OpenAI API key",
+    "STRIPE_SECRET_KEY": "Stripe secret key",
+    "STRIPE_PUBLISHABLE_KEY": "Stripe publishable key",
+}
+
+
+@dataclasses.dataclass(slots=True)
+class DeepAnalysis:
+    """Fields of an analysis dict that the doc generators read.
+    
+    Built once per generation so the generators use attribute access
+    instead of repeated dict lookups with defaults.
+    """
+    framework: str = "unknown"
+    categorized: dict[str, list[dict[str, str]]] = dataclasses.field(default_factory=dict)
+    patterns: dict[str, Any] = dataclasses.field(default_factory=dict)
+    scripts: dict[str, str] = dataclasses.field(default_factory=dict)
+    env_vars: list[str] = dataclasses.field(default_factory=list)
+    readme: dict[str, Any] = dataclasses.field(default_factory=dict)
+    entities: list[dict[str, Any]] = dataclasses.field(default_factory=list)
+    status_enums: list[dict[str, Any]] = dataclasses.field(default_factory=list)
+    
+    @classmethod
+    def from_dict(cls, analysis: dict[str, Any]) -> "DeepAnalysis":
+        """Accept both server output keys and raw deep_analyze_codebase keys."""
+        return cls(
+            framework=analysis.get("framework", "unknown"),
+            categorized=analysis.get("categorizedDependencies") or analysis.get("categorizedDeps") or {},
+            patterns=analysis.get("architecturePatterns") or {},
+            scripts=analysis.get("scripts") or {},
+            env_vars=analysis.get("envVars") or [],
+            readme=analysis.get("readme") or {},
+            entities=analysis.get("entities") or [],
+            status_enums=analysis.get("statusEnums") or [],
+        )
 
-def generate_tech_md(deep_analysis: dict[str, Any]) -> str:
+
+def generate_tech_md(deep_analysis: DeepAnalysis) -> str:
     """Generate tech.md - Technology stack documentation.
     
     Documents chosen frameworks, libraries, development tools, and technical constraints.
     When AI suggests implementations, it will prefer established stack over alternatives.
     """
-    framework = deep_analysis.get("framework", "unknown")
-    categorized = deep_analysis.get("categorizedDependencies", {}) or deep_analysis.get("categorizedDeps", {})
-    patterns = deep_analysis.get("architecturePatterns", {})
-    scripts = deep_analysis.get("scripts", {})
-    env_vars = deep_analysis.get("envVars", [])
+    framework = deep_analysis.framework
+    categorized = deep_analysis.categorized
+    scripts = deep_analysis.scripts
+    env_vars = deep_analysis.env_vars
     
     lines = ["# Technology Stack\n"]
     lines.append("This document defines the technology choices for this project. ")
@@ -92,11 +173,11 @@ def generate_tech_md(deep_analysis: dict[str, Any]) -> str:
     # Framework & Runtime
     lines.append("## Framework & Runtime\n")
     lines.append(f"- **Framework**: {FRAMEWORK_NAMES.get(framework, framework)}")
-    if framework in ["nextjs", "nextjs-pages", "react"]:
+    if framework in _REACT_LIKE:
         lines.append("- **UI Library**: React 19")
         lines.append("- **Language**: TypeScript 5")
         lines.append("- **Runtime**: Node.js 20+")
-    elif framework in ["vue", "nuxt"]:
+    elif framework in _VUE_LIKE:
         lines.append("- **UI Library**: Vue 3 (Composition API)")
         lines.append("- **Language**: TypeScript 5")
         lines.append("- **Runtime**: Node.js 20+")
@@ -106,10 +187,11 @@ def generate_tech_md(deep_analysis: dict[str, Any]) -> str:
     lines.append("")
     
     # Database & Backend
-    if categorized.get("Database"):
+    db_deps = categorized.get("Database")
+    if db_deps:
         lines.append("## Database & Backend\n")
         added_db = set()  # Track what we've already added
-        for dep in categorized["Database"]:
+        for dep in db_deps:
             purpose = dep.get("purpose", "")
             name = dep.get("name", "")
             if "supabase" in name.lower() and "supabase" not in added_db:
@@ -129,11 +211,24 @@ def generate_tech_md(deep_analysis: dict[str, Any]) -> str:
         lines.append("")
     
     # UI & Styling
-    if categorized.get("UI & Styling"):
+    has_tailwind = False
+    ui_deps = categorized.get("UI & Styling")
+    if ui_deps:
         lines.append("## UI & Styling\n")
         
-        has_tailwind = any("tailwind" in d["name"].lower() for d in categorized["UI & Styling"])
-        radix_count = sum(1 for d in categorized["UI & Styling"] if "@radix-ui" in d["name"])
+        # Single pass over the UI deps collecting everything the section needs
+        radix_count = 0
+        icon_lines = []
+        for dep in ui_deps:
+            name = dep["name"]
+            if "tailwind" in name:
+                has_tailwind = True
+            if name.startswith("@radix-ui"):
+                radix_count += 1
+            elif name == "lucide-react":
+                icon_lines.append("- **Icons**: Lucide React")
+            elif name == "@heroicons/react":
+                icon_lines.append("- **Icons**: Heroicons")
         
         if has_tailwind:
             lines.append("- **CSS Framework**: Tailwind CSS (utility-first)")
@@ -143,14 +238,11 @@ def generate_tech_md(deep_analysis: dict[str, Any]) -> str:
         elif radix_count > 0:
             lines.append("- **UI Primitives**: Radix UI")
         
-        for dep in categorized["UI & Styling"]:
-            if dep["name"] == "lucide-react":
-                lines.append("- **Icons**: Lucide React")
-            elif dep["name"] == "@heroicons/react":
-                lines.append("- **Icons**: Heroicons")
+        lines.extend(icon_lines)
         
-        if categorized.get("Other"):
-            for dep in categorized["Other"]:
+        other_deps = categorized.get("Other")
+        if other_deps:
+            for dep in other_deps:
                 if dep["name"] == "geist":
                     lines.append("- **Font**: Geist font family")
         
@@ -158,56 +250,15 @@ def generate_tech_md(deep_analysis: dict[str, Any]) -> str:
     
     # Key Libraries
     key_libs = []
-    
-    if categorized.get("Forms"):
-        for dep in categorized["Forms"]:
-            name = dep["name"].split("/")[-1]
-            if name == "zod":
-                key_libs.append("**Validation**: Zod (schema validation)")
-            elif "react-hook-form" in dep["name"]:
-                key_libs.append("**Forms**: React Hook Form")
-    
-    if categorized.get("State"):
-        for dep in categorized["State"]:
-            name = dep["name"]
-            if name == "zustand":
-                key_libs.append("**State Management**: Zustand")
-            elif name == "jotai":
-                key_libs.append("**State Management**: Jotai (atomic)")
-            elif "@reduxjs/toolkit" in name:
-                key_libs.append("**State Management**: Redux Toolkit")
-    
-    if categorized.get("Data Fetching"):
-        for dep in categorized["Data Fetching"]:
+    add_key_lib = key_libs.append
+    for category in _KEY_LIB_CATEGORIES:
+        for dep in categorized.get(category) or ():
             name = dep["name"]
-            if "@tanstack/react-query" in name:
-                key_libs.append("**Data Fetching**: TanStack Query")
-            elif name == "swr":
-                key_libs.append("**Data Fetching**: SWR")
-    
-    if categorized.get("Utilities"):
-        for dep in categorized["Utilities"]:
-            name = dep["name"]
-            if name == "date-fns":
-                key_libs.append("**Date Utilities**: date-fns")
-            elif name == "dayjs":
-                key_libs.append("**Date Utilities**: Day.js")
-    
-    if categorized.get("Charts"):
-        for dep in categorized["Charts"]:
-            key_libs.append(f"**Charts**: {dep['name']}")
-    
-    if categorized.get("Notifications"):
-        for dep in categorized["Notifications"]:
-            if dep["name"] == "sonner":
-                key_libs.append("**Notifications**: Sonner (toast)")
-            else:
-                key_libs.append(f"**Notifications**: {dep['name']}")
-    
-    if categorized.get("Theme"):
-        for dep in categorized["Theme"]:
-            if dep["name"] == "next-themes":
-                key_libs.append("**Theming**: next-themes")
+            line = _KEY_LIB_LINES.get(name) or _match_key_lib_prefix(name)
+            if line is None and category in _KEY_LIB_FALLBACK_LABELS:
+                line = f"{_KEY_LIB_FALLBACK_LABELS[category]}: {name}"
+            if line:
+                add_key_lib(line)
     
     if key_libs:
         lines.append("## Key Libraries\n")
@@ -237,19 +288,17 @@ def generate_tech_md(deep_analysis: dict[str, Any]) -> str:
         lines.append("Required environment variables (`.env.local`):\n")
         lines.append("| Variable | Description |")
         lines.append("|----------|-------------|")
-        for var in env_vars:
-            desc = _get_env_var_description(var)
-            lines.append(f"| `{var}` | {desc} |")
+        lines.append("\n".join([f"| `{var}` | {_get_env_var_description(var)} |" for var in env_vars]))
         lines.append("")
     
     # Technical Constraints
     lines.append("## Technical Constraints\n")
     lines.append("When generating code, follow these constraints:\n")
-    if framework in ["nextjs", "nextjs-pages"]:
+    if framework in _NEXT_LIKE:
         lines.append("- Use Server Components by default, Client Components only when needed")
         lines.append("- Prefer Server Actions for mutations")
         lines.append("- Use `next/image` for images, `next/link` for navigation")
-    if has_tailwind if 'has_tailwind' in dir() else False:
+    if has_tailwind:
         lines.append("- Use Tailwind CSS classes, avoid inline styles")
     lines.append("- Follow TypeScript strict mode")
     lines.append("")
@@ -257,23 +306,20 @@ def generate_tech_md(deep_analysis: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def _match_key_lib_prefix(name: str) -> str | None:
+    """Return the Key Libraries line for packages matched by name prefix."""
+    for prefix, line in _KEY_LIB_PREFIX_LINES:
+        if name.startswith(prefix):
+            return line
+    return None
+
+
+@functools.lru_cache(maxsize=128)
 def _get_env_var_description(var: str) -> str:
     """Get description for common environment variables."""
-    descriptions = {
-        "DATABASE_URL": "Database connection string",
-        "NEXT_PUBLIC_SUPABASE_URL": "Supabase project URL",
-        "NEXT_PUBLIC_SUPABASE_ANON_KEY": "Supabase anonymous key (public)",
-        "SUPABASE_SERVICE_ROLE_KEY": "Supabase service role key (server-only)",
-        "NEXTAUTH_SECRET": "NextAuth.js secret",
-        "NEXTAUTH_URL": "NextAuth.js URL",
-        "OPENAI_API_KEY": "OpenAI API key",
-        "STRIPE_SECRET_KEY": "Stripe secret key",
-        "STRIPE_PUBLISHABLE_KEY": "Stripe publishable key",
-    }
-    
     # Check exact match first
-    if var in descriptions:
-        return descriptions[var]
+    if var in _ENV_VAR_DESCRIPTIONS:
+        return _ENV_VAR_DESCRIPTIONS[var]
     
     # Pattern matching
     var_upper = var.upper()
@@ -295,26 +341,9 @@ def _get_env_var_description(var: str) -> str:
     return "Required"
 
 
-def generate_structure_md(deep_analysis: dict[str, Any]) -> str:
-    """Generate structure.md - Project structure documentation.
-    
-    Outlines file organization, naming conventions, import patterns, and 
-    architectural decisions. Ensures generated code fits seamlessly into 
-    existing codebase.
-    """
-    framework = deep_analysis.get("framework", "unknown")
-    patterns = deep_analysis.get("architecturePatterns", {})
-    components = deep_analysis.get("components", [])
-    
-    lines = ["# Project Structure\n"]
-    lines.append("This document defines the project organization and architectural patterns.")
-    lines.append("Follow these conventions when creating new files and components.\n")
-    
-    # Framework-specific structure
-    lines.append("## Directory Structure\n")
-    
-    structures = {
-        "nextjs": """```
+# Directory tree shown in structure.md, per framework
+_STRUCTURES = {
+    "nextjs": """```
 ├── app/                    # Next.js App Router
 │   ├── (routes)/          # Route groups
 │   ├── api/               # API Route Handlers
@@ -338,7 +367,7 @@ def generate_structure_md(deep_analysis: dict[str, Any]) -> str:
 │
 └── config files          # next.config.ts, tailwind.config.ts, etc.
 ```""",
-        "nextjs-pages": """```
+    "nextjs-pages": """```
 ├── pages/                 # Next.js Pages Router
 │   ├── api/              # API routes
 │   ├── _app.tsx          # App wrapper
@@ -354,7 +383,7 @@ def generate_structure_md(deep_analysis: dict[str, Any]) -> str:
 ├── styles/               # CSS/SCSS files
 └── public/               # Static assets
 ```""",
-        "laravel": """```
+    "laravel": """```
 ├── app/
 │   ├── Http/
 │   │   ├── Controllers/   # Request handlers
@@ -377,7 +406,7 @@ def generate_structure_md(deep_analysis: dict[str, Any]) -> str:
 │
 └── public/               # Public assets
 ```""",
-        "react": """```
+    "react": """```
 ├── src/
 │   ├── components/        # React components
 │   │   ├── ui/           # Reusable UI components
@@ -393,7 +422,7 @@ def generate_structure_md(deep_analysis: dict[str, Any]) -> str:
 ├── public/               # Static assets
 └── vite.config.ts        # Vite configuration
 ```""",
-        "vue": """```
+    "vue": """```
 ├── src/
 │   ├── components/        # Vue components
 │   │   ├── ui/           # Reusable UI components
@@ -408,7 +437,7 @@ def generate_structure_md(deep_analysis: dict[str, Any]) -> str:
 ├── public/               # Static assets
 └── vite.config.ts        # Vite configuration
 ```""",
-        "nuxt": """```
+    "nuxt": """```
 ├── pages/                 # File-based routing (auto-imported)
 ├── components/            # Vue components (auto-imported)
 │   ├── ui/               # Reusable UI components
@@ -421,15 +450,35 @@ def generate_structure_md(deep_analysis: dict[str, Any]) -> str:
 ├── public/               # Static assets
 └── nuxt.config.ts        # Nuxt configuration
 ```""",
-    }
+}
+
+_DEFAULT_STRUCTURE = "```\n# Project structure varies by framework\n```"
+
+
+def generate_structure_md(deep_analysis: DeepAnalysis) -> str:
+    """Generate structure.md - Project structure documentation.
     
-    lines.append(structures.get(framework, "```\n# Project structure varies by framework\n```"))
+    Outlines file organization, naming conventions, import patterns, and 
+    architectural decisions. Ensures generated code fits seamlessly into 
+    existing codebase.
+    """
+    framework = deep_analysis.framework
+    patterns = deep_analysis.patterns
+    
+    lines = ["# Project Structure\n"]
+    lines.append("This document defines the project organization and architectural patterns.")
+    lines.append("Follow these conventions when creating new files and components.\n")
+    
+    # Framework-specific structure
+    lines.append("## Directory Structure\n")
+    
+    lines.append(_STRUCTURES.get(framework, _DEFAULT_STRUCTURE))
     lines.append("")
     
     # Naming Conventions
     lines.append("## Naming Conventions\n")
     
-    if framework in ["nextjs", "nextjs-pages", "react"]:
+    if framework in _REACT_LIKE:
         lines.append("| Type | Convention | Example |")
         lines.append("|------|------------|---------|")
         lines.append("| Components | PascalCase | `UserProfile.tsx` |")
@@ -438,7 +487,7 @@ def generate_structure_md(deep_analysis: dict[str, Any]) -> str:
         lines.append("| Types | PascalCase | `User`, `ApiResponse` |")
         lines.append("| Constants | SCREAMING_SNAKE_CASE | `MAX_ITEMS` |")
         lines.append("| Files | kebab-case or PascalCase | `user-profile.tsx` |")
-    elif framework in ["vue", "nuxt"]:
+    elif framework in _VUE_LIKE:
         lines.append("| Type | Convention | Example |")
         lines.append("|------|------------|---------|")
         lines.append("| Components | PascalCase | `UserProfile.vue` |")
@@ -479,7 +528,7 @@ def generate_structure_md(deep_analysis: dict[str, Any]) -> str:
     # Import Patterns
     lines.append("## Import Conventions\n")
     
-    if framework in ["nextjs", "nextjs-pages", "react"]:
+    if framework in _REACT_LIKE:
         lines.append("```typescript")
         lines.append("// 1. React/Next imports")
         lines.append("import { useState, useEffect } from 'react'")
@@ -493,7 +542,7 @@ def generate_structure_md(deep_analysis: dict[str, Any]) -> str:
         lines.append("import { cn } from '@/lib/utils'")
         lines.append("import type { User } from '@/lib/types'")
         lines.append("```\n")
-    elif framework in ["vue", "nuxt"]:
+    elif framework in _VUE_LIKE:
         lines.append("```typescript")
         lines.append("// 1. Vue imports")
         lines.append("import { ref, computed } from 'vue'")
@@ -510,14 +559,14 @@ def generate_structure_md(deep_analysis: dict[str, Any]) -> str:
     lines.append("## Key Files\n")
     lines.append("Reference these files for implementation patterns:\n")
     
-    if framework in ["nextjs", "nextjs-pages"]:
+    if framework in _NEXT_LIKE:
         lines.append("- Types: #[[file:lib/types.ts]]")
         lines.append("- Utilities: #[[file:lib/utils.ts]]")
         lines.append("- Root Layout: #[[file:app/layout.tsx]]")
     elif framework == "react":
         lines.append("- Types: #[[file:src/types/index.ts]]")
         lines.append("- App Entry: #[[file:src/App.tsx]]")
-    elif framework in ["vue", "nuxt"]:
+    elif framework in _VUE_LIKE:
         lines.append("- Types: #[[file:types/index.ts]]")
         lines.append("- App Config: #[[file:nuxt.config.ts]]" if framework == "nuxt" else "- App Entry: #[[file:src/App.vue]]")
     
@@ -526,17 +575,16 @@ def generate_structure_md(deep_analysis: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def generate_product_md(deep_analysis: dict[str, Any]) -> str:
+def generate_product_md(deep_analysis: DeepAnalysis) -> str:
     """Generate product.md - Product overview documentation.
     
     Defines product's purpose, target users, key features, and business objectives.
     Helps AI understand the "why" behind technical decisions and suggest solutions 
     aligned with product goals.
     """
-    readme = deep_analysis.get("readme", {})
-    entities = deep_analysis.get("entities", [])
-    status_enums = deep_analysis.get("statusEnums", [])
-    framework = deep_analysis.get("framework", "unknown")
+    readme = deep_analysis.readme
+    entities = deep_analysis.entities
+    status_enums = deep_analysis.status_enums
     
     lines = ["# Product Overview\n"]
     lines.append("This document defines the product context and business domain.")
@@ -641,6 +689,11 @@ def generate_product_md(deep_analysis: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+# Fixed Kiro front-matter, prepended to content as-is
+_KIRO_PREFIX = "---\ninclusion: always\n---\n\n"
+_KIRO_MANUAL_PREFIX = "---\ninclusion: manual\n---\n\n"
+
+
 def _wrap_kiro_format(
     content: str, 
     inclusion: InclusionMode = "always",
@@ -661,17 +714,9 @@ fileMatchPattern: "{file_match_pattern}"
 
 {content}"""
     elif inclusion == "manual":
-        return f"""---
-inclusion: manual
----
-
-{content}"""
+        return _KIRO_MANUAL_PREFIX + content
     else:
-        return f"""---
-inclusion: always
----
-
-{content}"""
+        return _KIRO_PREFIX + content
 
 
 def _wrap_cursor_format(content: str, description: str) -> str:
@@ -706,46 +751,64 @@ def generate_steering_docs_deep(
     - tech.md - Technology stack, frameworks, libraries, constraints
     - structure.md - File organization, naming conventions, architecture
     """
-    
-    framework = deep_analysis.get("framework", "unknown")
+    analysis = DeepAnalysis.from_dict(deep_analysis)
     
     # Generate 3 foundational docs (like Kiro)
     docs = {
-        "product.md": generate_product_md(deep_analysis),
-        "tech.md": generate_tech_md(deep_analysis),
-        "structure.md": generate_structure_md(deep_analysis),
+        "product.md": generate_product_md(analysis),
+        "tech.md": generate_tech_md(analysis),
+        "structure.md": generate_structure_md(analysis),
     }
     
-    config = IDE_CONFIGS.get(output_format, IDE_CONFIGS["markdown"])
-    
-    # === KIRO: Multiple files with front-matter ===
-    if output_format == "kiro":
-        result = {}
-        for name, content in docs.items():
-            wrapped = _wrap_kiro_format(content, inclusion="always")
-            result[f"{config['path']}{name}"] = wrapped
-        return result
-    
-    # === CURSOR: Single .mdc file ===
-    if output_format == "cursor":
-        combined = "\n\n---\n\n".join(docs.values())
-        wrapped = _wrap_cursor_format(
-            combined, 
-            f"Project steering for {FRAMEWORK_NAMES.get(framework, framework)}"
-        )
-        return {f"{config['path']}{config['filename']}": wrapped}
-    
-    # === COPILOT: .github/copilot-instructions.md ===
-    if output_format == "copilot":
-        combined = "\n\n---\n\n".join(docs.values())
-        wrapped = _wrap_copilot_format(combined)
-        return {f"{config['path']}{config['filename']}": wrapped}
-    
-    # === All others: plain markdown ===
+    handler = _FORMAT_HANDLERS.get(output_format, _emit_plain)
+    return handler(docs, output_format, analysis.framework)
+
+
+# === Per-format output handlers: (docs, output_format, framework) -> {path: content} ===
+
+def _emit_kiro(docs: dict[str, str], output_format: str, framework: str) -> dict[str, str]:
+    """Kiro: multiple files with front-matter."""
+    return {_KIRO_DIR + name: _KIRO_PREFIX + content for name, content in docs.items()}
+
+
+def _emit_cursor(docs: dict[str, str], output_format: str, framework: str) -> dict[str, str]:
+    """Cursor: single .mdc file."""
     combined = "\n\n---\n\n".join(docs.values())
-    filename = config.get("filename", "STEERING.md")
-    path = config.get("path", "")
-    return {f"{path}{filename}": combined}
+    wrapped = _wrap_cursor_format(
+        combined, 
+        f"Project steering for {FRAMEWORK_NAMES.get(framework, framework)}"
+    )
+    return {_OUTPUT_PATHS["cursor"]: wrapped}
+
+
+def _emit_copilot(docs: dict[str, str], output_format: str, framework: str) -> dict[str, str]:
+    """Copilot: .github/copilot-instructions.md."""
+    combined = "\n\n---\n\n".join(docs.values())
+    return {_OUTPUT_PATHS["copilot"]: _wrap_copilot_format(combined)}
+
+
+def _emit_plain(docs: dict[str, str], output_format: str, framework: str) -> dict[str, str]:
+    """All others: plain markdown in the format's single file."""
+    combined = "\n\n---\n\n".join(docs.values())
+    return {_OUTPUT_PATHS.get(output_format, _OUTPUT_PATHS["markdown"]): combined}
+
+
+_FORMAT_HANDLERS = {
+    "kiro": _emit_kiro,
+    "cursor": _emit_cursor,
+    "copilot": _emit_copilot,
+}
+
+
+# Keys that only appear in deep analysis output (server or deep_analyze_codebase)
+_DEEP_KEYS = frozenset({
+    "categorizedDependencies",
+    "categorizedDeps",
+    "readme",
+    "entities",
+    "architecturePatterns",
+    "patterns",
+})
 
 
 # Keep old function for backward compatibility
@@ -755,7 +818,7 @@ def generate_steering_docs(
 ) -> dict[str, str]:
     """Generate steering docs (basic version for backward compatibility)."""
     # If deep analysis data is present, use new generator
-    if "categorizedDependencies" in analysis:
+    if not _DEEP_KEYS.isdisjoint(analysis):
         return generate_steering_docs_deep(analysis, output_format)
     
     # Otherwise use simple generation
@@ -12,8 +12,6 @@ from typing import Literal
 import json
 
 from .detector import detect_framework, get_important_files, FrameworkType
-from .analyzer import analyze_codebase
-from .deep_analyzer import deep_analyze_codebase
 from .generator import (
     generate_steering_docs, 
     OutputFormat, 
@@ -95,6 +93,8 @@ def analyze_project(project_path: str, framework: str | None = None) -> dict:
     Returns:
         Structured analysis including tech stack, types, routes, models, etc.
     """
+    from .analyzer import analyze_codebase
+    
     if framework is None:
         framework = detect_framework(project_path)
     
@@ -129,6 +129,7 @@ def generate_steering(
         Dictionary with generated files info and status
     """
     from pathlib import Path
+    from .analyzer import analyze_codebase
     
     if framework is None:
         framework = detect_framework(project_path)
@@ -202,6 +203,9 @@ def deep_analyze_project(project_path: str, framework: str | None = None) -> dic
     Returns:
         Comprehensive analysis with categorized deps, patterns, code snippets, etc.
     """
+    from .analyzer import analyze_codebase
+    from .deep_analyzer import deep_analyze_codebase
+    
     if framework is None:
         framework = detect_framework(project_path)
     